@@ -1,29 +1,37 @@
+import hmac
 from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi.responses import Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 from models.analysis import SynthesisRequest, SynthesisResult
-from services.analyzer import run_synthesis_analysis
+from services.analyzer import (
+    run_batch_synthesis_analysis, run_synthesis_analysis, stream_synthesis_analysis)
 from core import config
-from typing import Optional
+from typing import List, Optional
 
 router = APIRouter()
 # Don't auto-error so we can handle it ourselves
 security = HTTPBearer(auto_error=False)
 
+# Settings are fixed for the life of the process, so decide once whether the
+# API key is checked: not with dummy data, and not when no key is configured.
+_API_KEY_REQUIRED = bool(config.API_KEY and not config.USE_DUMMY_DATA)
+_API_KEY_BYTES = (config.API_KEY or "").encode()
+
+_BATCH_RESULT_ADAPTER = TypeAdapter(List[SynthesisResult])
+
 
 def verify_api_key(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> bool:
     """
     Verify API key for protected endpoints.
     Only required when USE_DUMMY_DATA is False and API_KEY is set.
     """
-    if config.USE_DUMMY_DATA:
-        # No API key required when using dummy data
-        return True
-
-    if not config.API_KEY:
-        # No API key configured, allow access
+    if not _API_KEY_REQUIRED:
         return True
 
-    if not credentials or credentials.credentials != config.API_KEY:
+    # compare_digest keeps the comparison time independent of the key contents
+    if not credentials or not hmac.compare_digest(credentials.credentials.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=401,
             detail="Invalid API key. Contact the administrator for access."
@@ -36,12 +44,15 @@ async def get_config():
     """Get frontend configuration."""
     return {
         "use_dummy_data": config.USE_DUMMY_DATA,
-        "requires_api_key": bool(config.API_KEY and not config.USE_DUMMY_DATA),
+        "requires_api_key": _API_KEY_REQUIRED,
         "demo_mode_enabled": config.USE_DUMMY_DATA
     }
 
 
-@router.post("/synthesize", response_model=SynthesisResult)
+# The result is already a validated SynthesisResult, so it is serialized
+# directly; `responses` keeps the model in the OpenAPI schema without
+# FastAPI validating it a second time
+@router.post("/synthesize", responses={200: {"model": SynthesisResult}})
 async def synthesis_analysis_endpoint(
     request: SynthesisRequest,
     api_key_valid: bool = Depends(verify_api_key)
@@ -57,4 +68,58 @@ async def synthesis_analysis_endpoint(
             status_code=400, detail="Text input cannot be empty")
 
     result = await run_synthesis_analysis(request.text)
-    return result
+    return Response(content=result.model_dump_json(exclude_none=True),
+                    media_type="application/json")
+
+
+@router.post("/synthesize/batch", responses={200: {"model": List[SynthesisResult]}})
+async def synthesis_batch_endpoint(
+    requests: List[SynthesisRequest],
+    api_key_valid: bool = Depends(verify_api_key)
+):
+    """
+    Perform synthesis analysis on several texts at once.
+
+    Texts are analyzed concurrently and the results are returned in the
+    same order as the requests. At most BATCH_MAX_SIZE texts are accepted.
+    """
+    if not requests:
+        raise HTTPException(
+            status_code=400, detail="Batch cannot be empty")
+    if len(requests) > config.BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch cannot contain more than {config.BATCH_MAX_SIZE} texts")
+    if any(not request.text or not request.text.strip() for request in requests):
+        raise HTTPException(
+            status_code=400, detail="Text input cannot be empty")
+
+    results = await run_batch_synthesis_analysis([request.text for request in requests])
+    return Response(content=_BATCH_RESULT_ADAPTER.dump_json(results, exclude_none=True),
+                    media_type="application/json")
+
+
+@router.post("/synthesize/stream")
+async def synthesis_stream_endpoint(
+    request: SynthesisRequest,
+    api_key_valid: bool = Depends(verify_api_key)
+):
+    """
+    Perform synthesis analysis, streaming each section as Server-Sent Events.
+
+    Each of foundational_assumptions, synthesized_text and omissions is sent
+    as a `section` event once ready, followed by a final `done` event. A
+    section may be sent more than once as it fills in; the latest one wins.
+    """
+    if not request.text or not request.text.strip():
+        raise HTTPException(
+            status_code=400, detail="Text input cannot be empty")
+
+    async def events():
+        async for section, value in stream_synthesis_analysis(request.text):
+            payload = to_json({"section": section, "data": value})
+            yield b"event: section\ndata: " + payload + b"\n\n"
+        yield b"event: done\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
@@ -1,8 +1,19 @@
 # Configuration using Pydantic BaseSettings for validation and type safety
-import os
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from pydantic import Field
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class Deployment(BaseModel):
+    """An additional Azure OpenAI deployment that LLM calls can be routed to."""
+
+    deployment_name: str
+    # Unset values fall back to the primary AZURE_OPENAI_* settings
+    endpoint: Optional[str] = None
+    api_key: Optional[str] = None
+    api_version: Optional[str] = None
+    max_concurrency: int = Field(8, ge=1)
 
 
 class Settings(BaseSettings):
@@ -17,6 +28,22 @@ class Settings(BaseSettings):
         ..., env="AZURE_OPENAI_DEPLOYMENT_NAME", description="Azure OpenAI deployment name")
     azure_openai_api_version: str = Field(
         "2024-02-01", env="AZURE_OPENAI_API_VERSION", description="Azure OpenAI API version")
+    azure_openai_max_concurrency: int = Field(
+        8, ge=1, env="AZURE_OPENAI_MAX_CONCURRENCY", description="Concurrent LLM calls allowed on the primary deployment")
+    azure_openai_deployments: List[Deployment] = Field(
+        default_factory=list, env="AZURE_OPENAI_DEPLOYMENTS", description="Extra deployments to spread LLM calls across (JSON list)")
+    max_concurrent_llm_calls: int = Field(
+        32, ge=1, env="MAX_CONCURRENT_LLM_CALLS", description="Concurrent LLM calls allowed across all deployments")
+    split_signatures: bool = Field(
+        False, env="SPLIT_SIGNATURES", description="Make one LLM call per analysis instead of a single combined call")
+    sentences_per_call: int = Field(
+        15, ge=1, env="SENTENCES_PER_CALL", description="With split signatures, sentences analyzed per LLM call; longer texts are split into concurrent calls")
+    batch_max_size: int = Field(
+        32, ge=1, env="BATCH_MAX_SIZE", description="Most texts accepted in one batch request")
+    batch_max_concurrency: int = Field(
+        16, ge=1, env="BATCH_MAX_CONCURRENCY", description="Texts from one batch request analyzed at once")
+    max_chunk_tokens: int = Field(
+        2000, ge=100, env="MAX_CHUNK_TOKENS", description="Longer texts are split into chunks of this many tokens, analyzed concurrently")
 
     # API Protection
     api_key: Optional[str] = Field(
@@ -26,10 +53,20 @@ class Settings(BaseSettings):
     use_dummy_data: bool = Field(
         True, env="USE_DUMMY_DATA", description="Use dummy data instead of real API calls")
 
+    # Response Cache
+    response_cache_size: int = Field(
+        1024, ge=0, env="RESPONSE_CACHE_SIZE", description="Analysis results kept in memory for repeated texts (0 disables)")
+    response_cache_ttl: int = Field(
+        86400, ge=0, env="RESPONSE_CACHE_TTL", description="Seconds a cached analysis stays valid (0 keeps it until evicted)")
+    response_cache_dir: Optional[str] = Field(
+        None, env="RESPONSE_CACHE_DIR", description="Directory for a persistent on-disk result cache shared by all workers (unset keeps it in memory)")
+
     # Server Configuration
     debug: bool = Field(False, env="DEBUG", description="Enable debug mode")
     host: str = Field("0.0.0.0", env="HOST", description="Server host")
     port: int = Field(8000, env="PORT", description="Server port")
+    web_concurrency: int = Field(
+        1, ge=1, env="WEB_CONCURRENCY", description="Server worker processes; each has its own result cache and LLM concurrency limits")
 
     class Config:
         env_file = ".env"
@@ -37,13 +74,21 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra environment variables
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read and validate settings once per process."""
+    return Settings()
+
 
-# Backward compatibility with existing code
-AZURE_OPENAI_ENDPOINT = settings.azure_openai_endpoint
-AZURE_OPENAI_KEY = settings.azure_openai_key
-AZURE_OPENAI_DEPLOYMENT_NAME = settings.azure_openai_deployment_name
-AZURE_OPENAI_API_VERSION = settings.azure_openai_api_version
-API_KEY = settings.api_key
-USE_DUMMY_DATA = settings.use_dummy_data
+def __getattr__(name: str):
+    """
+    Backward compatibility with existing code: ``config.API_KEY`` and friends
+    resolve lazily to the matching field on the cached settings instance.
+    """
+    if name == "settings":
+        return get_settings()
+    settings = get_settings()
+    field = name.lower()
+    if name.isupper() and field in Settings.model_fields:
+        return getattr(settings, field)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
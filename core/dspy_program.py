@@ -2,30 +2,282 @@
 DSPy-based program for the Narrative Deconstruction Toolkit.
 """
 
+import re
 import dspy
+import logging
 import asyncio
-from typing import List, Dict, Any
+import litellm
+import orjson
+import json_repair
+from concurrent.futures import ThreadPoolExecutor
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import List, Dict, Any, AsyncIterator, Iterable, Optional, Tuple, get_args
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+from dspy.utils.exceptions import AdapterParseError
+from core.llm_pool import LLMPool
+from core.text_utils import first_sentences, group_sentences, iter_sentences
 from models.analysis import SynthesizedSentence, Omission
 
+logger = logging.getLogger(__name__)
+
+
+# Bump whenever the signatures' instructions or fields change, so cached
+# results produced by the old prompts are no longer used
+PROMPT_VERSION = "3"
+
+# Matches a leading ```json / ``` fence and a trailing ``` fence in one pass.
+# \A and \Z anchor to the whole string, so fences inside values are kept.
+_FENCE_RE = re.compile(r'\A\s*```(?i:json)?\s*|\s*```\s*\Z')
+
+# Built once at import; validating a whole list here runs in pydantic-core
+# instead of constructing each model from Python.
+_SENT_ADAPTER = TypeAdapter(List[SynthesizedSentence])
+_OMISSION_ADAPTER = TypeAdapter(List[Omission])
+
+# Rate limits, timeouts and provider hiccups are worth another attempt;
+# bad requests and unparseable outputs are not
+_TRANSIENT_LLM_ERRORS = (
+    litellm.RateLimitError,
+    litellm.Timeout,
+    litellm.APIConnectionError,
+    litellm.ServiceUnavailableError,
+    litellm.InternalServerError,
+)
+
+
+def _is_transient_llm_error(error: BaseException) -> bool:
+    """
+    Whether an LM call failed with a transient error worth retrying.
+
+    On the synchronous path JSONAdapter first tries structured outputs, then
+    JSON mode, and wraps the second failure in a RuntimeError, so the cause
+    is checked as well.
+    """
+    return isinstance(error, _TRANSIENT_LLM_ERRORS) or isinstance(
+        error.__cause__, _TRANSIENT_LLM_ERRORS)
+
+
+_llm_retry = retry(
+    retry=retry_if_exception(_is_transient_llm_error),
+    wait=wait_random_exponential(multiplier=1, max=10),
+    stop=stop_after_attempt(3),
+    reraise=True
+)
+
+# Templates for fallback entries. The models are frozen, so model_copy can
+# fill in the varying fields without running validation again.
+_DEFAULT_SENTENCE = SynthesizedSentence(
+    sentence="", bias_score=0.0, justification="", tactics=())
+_DEFAULT_OMISSION = Omission(omitted_perspective="", potential_impact="")
+_UNAVAILABLE_OMISSION = Omission(
+    omitted_perspective="Analysis temporarily unavailable",
+    potential_impact="Unable to identify omissions at this time"
+)
+
+@dataclass(slots=True)
+class _EmptyResult:
+    """Stand-in for a failed analysis step; the _process_* fallbacks handle it."""
+    assumptions_json: list = field(default_factory=list)
+    analysis_json: list = field(default_factory=list)
+    omissions_json: list = field(default_factory=list)
+
+
+# Shared by every failed step; the _process_* methods never mutate it
+_EMPTY_RESULT = _EmptyResult()
+
+
+def _decode_completion(text: str) -> Tuple[Any, bool]:
+    """
+    Decode a raw LM completion that the adapter could not parse as is.
+
+    The text is stripped of markdown fences and decoded with orjson.
+    Truncated output is decoded partially, dropping only a trailing string
+    that was cut short, and otherwise malformed JSON (single quotes,
+    trailing commas, ...) is repaired.
+
+    Args:
+        text: The raw completion.
+
+    Returns:
+        The decoded value (None if the text cannot be decoded), and whether
+        the text was truncated.
+    """
+    cleaned = text.strip()
+    # Bare JSON (the norm in JSON mode) skips the fence regex entirely
+    if not cleaned.startswith(('[', '{')):
+        cleaned = _FENCE_RE.sub('', cleaned)
+    try:
+        return orjson.loads(cleaned), False
+    except orjson.JSONDecodeError as e:
+        # Output cut off by max_tokens fails at its very end; anything else
+        # (trailing text, bad quoting, ...) is left for the repair below
+        truncated = e.pos >= len(cleaned)
+    if truncated:
+        try:
+            decoded = from_json(cleaned, allow_partial=True)
+        except ValueError:
+            pass
+        else:
+            # Logged so max_tokens budgets can be retuned if this shows up often
+            logger.warning("LM output was truncated at %d chars; keeping the complete items",
+                           len(cleaned))
+            return decoded, True
+    # Only JSON-shaped text is repaired: json_repair turns prose into ""
+    if cleaned.startswith(('[', '{')):
+        repaired = json_repair.loads(cleaned)
+        if repaired:
+            logger.warning("Repaired malformed JSON in LM output")
+            return repaired, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _item_adapter(item_type: Any) -> TypeAdapter:
+    """TypeAdapter for the items of a list output field, built once per type."""
+    return TypeAdapter(item_type)
+
+
+def _coerce_sentence(item: Any) -> Optional[SynthesizedSentence]:
+    """
+    Validate one sentence analysis item. Models pass through untouched, an
+    invalid dict becomes a placeholder for its sentence, and anything else
+    is dropped (None).
+    """
+    if isinstance(item, SynthesizedSentence):
+        return item
+    if not isinstance(item, dict):
+        return None
+    try:
+        return SynthesizedSentence.model_validate(item)
+    except ValidationError as e:
+        logger.warning("Invalid sentence analysis item: %s", e)
+        return _DEFAULT_SENTENCE.model_copy(update={
+            "sentence": str(item.get('sentence', 'Unknown sentence')),
+            "justification": "Analysis format error"
+        })
+
+
+def _unavailable_sentences(sentences: Iterable[str]) -> List[SynthesizedSentence]:
+    """Placeholder entries for sentences whose analysis is unavailable."""
+    return [
+        _DEFAULT_SENTENCE.model_copy(update={
+            "sentence": sentence,
+            "justification": "Analysis temporarily unavailable"
+        }) for sentence in sentences
+    ]
+
+
+def _coerce_omission(item: Any) -> Optional[Omission]:
+    """Validate one omission item, like _coerce_sentence."""
+    if isinstance(item, Omission):
+        return item
+    if not isinstance(item, dict):
+        return None
+    try:
+        return Omission.model_validate(item)
+    except ValidationError as e:
+        logger.warning("Invalid omission item: %s", e)
+        return _DEFAULT_OMISSION.model_copy(update={
+            "omitted_perspective": str(item.get('omitted_perspective', 'Unknown omission')),
+            "potential_impact": "Analysis format error"
+        })
+
+
+class LenientJSONAdapter(dspy.JSONAdapter):
+    """
+    JSONAdapter that keeps the usable part of an output that fails to parse.
+
+    JSONAdapter validates every typed output field, so one malformed item (an
+    omission missing ``potential_impact``, say) or a missing field fails the
+    whole call, and with it every section of a combined analysis. Instead,
+    the raw completion is decoded here and its fields are returned as plain
+    JSON values, for the pipeline's _process_* steps to validate item by item.
+    """
+
+    def parse(self, signature, completion: str) -> Dict[str, Any]:
+        try:
+            return super().parse(signature, completion)
+        except (AdapterParseError, ValueError) as e:
+            decoded, truncated = _decode_completion(completion)
+            if not isinstance(decoded, dict):
+                raise
+            logger.warning("%s output failed validation, keeping its valid items: %s",
+                           signature.__name__, e)
+            if truncated and decoded:
+                self._drop_incomplete_item(signature, decoded)
+            return {name: decoded.get(name) for name in signature.output_fields}
+
+    async def acall(self, lm, lm_kwargs, signature, demos, inputs):
+        # BaseAdapter.acall, plus a check of why the generation stopped. The
+        # parse (json_repair, then pydantic over every field) is CPU-bound
+        # and runs on a worker thread, so the event loop keeps serving other
+        # requests meanwhile.
+        processed_signature = self._call_preprocess(lm, lm_kwargs, signature, inputs)
+        inputs = self.format(processed_signature, demos, inputs)
+
+        outputs = await lm.acall(messages=inputs, **lm_kwargs)
+        self._log_truncation(
+            lm, signature, lm_kwargs.get("max_tokens", lm.kwargs.get("max_tokens")))
+        return await asyncio.to_thread(self._call_postprocess, signature, outputs)
+
+    @staticmethod
+    def _log_truncation(lm, signature, max_tokens: Optional[int]) -> None:
+        """
+        Log a generation that stopped at max_tokens, naming its signature.
+
+        Truncated output often still parses (json_repair closes it), so this
+        is the one place a truncation shows up reliably. The entry for this
+        call is the LM's latest: nothing is awaited between the LM appending
+        it and returning.
+        """
+        if not lm.history:
+            return
+        response = lm.history[-1].get("response")
+        if any(getattr(choice, "finish_reason", None) == "length"
+               for choice in getattr(response, "choices", ())):
+            # Logged so max_tokens budgets can be retuned if this shows up often
+            logger.warning("%s output was truncated at max_tokens=%s",
+                           signature.__name__, max_tokens)
+
+    @staticmethod
+    def _drop_incomplete_item(signature, decoded: Dict[str, Any]) -> None:
+        """
+        Drop the last item of a truncated output if it was cut short.
+
+        Only the field decoded last can have been cut off, and within it only
+        its last item. Incomplete trailing strings are already left out by
+        the partial decode, so an item is dropped only when it fails
+        validation (e.g. a dict missing its later keys).
+        """
+        name = next(reversed(decoded))
+        items = decoded[name]
+        if name not in signature.output_fields or not isinstance(items, list) or not items:
+            return
+        item_type = get_args(signature.output_fields[name].annotation)
+        if not item_type:
+            return
+        try:
+            _item_adapter(item_type[0]).validate_python(items[-1])
+        except ValidationError:
+            decoded[name] = items[:-1]
+
 
 class FoundationalAssumptionsSignature(dspy.Signature):
     """
-    You are an expert in critical theory and logical reasoning. Your task is to
-    identify the foundational, unstated assumptions embedded in a given text.
-
-    A foundational assumption is a core belief the author takes for granted,
-    assuming the reader will accept it without question. These are often invisible
-    pillars supporting the entire argument. Do not identify surface-level claims.
-    Instead, dig deeper for the fundamental beliefs about the world, society,
-    human nature, or morality that *must* be true for the author's argument to hold.
-
-    Consider these categories:
-    - **Epistemological:** What does the author assume about the nature of knowledge and truth?
-    - **Metaphysical/Ontological:** What does the author assume about the nature of reality?
-    - **Ethical/Moral:** What does the author assume about what is right and wrong?
-    - **Social/Political:** What does the author assume about how society or power works?
-
-    Identify upto 6 of the most significant foundational assumptions.
+    Identify the foundational, unstated assumptions of a text: core beliefs the
+    author takes for granted that *must* be true for the argument to hold. Skip
+    surface-level claims.
+
+    Consider beliefs about:
+    - **Epistemological:** knowledge and truth
+    - **Metaphysical/Ontological:** the nature of reality
+    - **Ethical/Moral:** right and wrong
+    - **Social/Political:** how society and power work
+
+    Identify up to 6 of the most significant.
     """
     text: str = dspy.InputField(
         desc="The text to analyze for its foundational assumptions."
@@ -37,24 +289,15 @@ class FoundationalAssumptionsSignature(dspy.Signature):
 
 class SentenceAnalysisSignature(dspy.Signature):
     """
-    You are a meticulous rhetorical analyst and linguistics expert. Your task is to
-    dissect a given text sentence by sentence. For EACH sentence, you will
-    provide a structured analysis covering its bias and any embedded rhetorical tactics.
-
-    **Instructions:**
-    1.  Go through the text and analyze every single sentence.
-    2.  For each sentence, create a `SynthesizedSentence` object.
-    3.  **Bias Score:** Assign a `bias_score` from -1.0 to 1.0.
-        - **-1.0:** Represents extremely negative, hostile, or derogatory bias.
-        - **0.0:** Represents neutral, objective, or purely factual language.
-        - **1.0:** Represents extremely positive, laudatory, or promotional bias.
-        - Provide a concise `justification` for your score, quoting the specific
-          words that signal the bias.
-    4.  **Rhetorical Tactics:** Identify all `tactics` within the sentence.
-        - For each tactic, the `phrase` must be the *exact* substring from the sentence.
-        - Name the `tactic` (e.g., "Appeal to Fear," "Loaded Language," "False Dichotomy").
-        - Provide a clear `explanation` of how the tactic functions in this context.
-        - Classify the `type` of tactic (e.g., 'Emotional Appeal', 'Logical Fallacy', 'Framing').
+    Analyze EVERY sentence of a text for bias and rhetorical tactics.
+
+    - `bias_score`: -1.0 (hostile, derogatory) to 0.0 (neutral, factual) to
+      1.0 (laudatory, promotional), with a concise `justification` quoting
+      the words that signal the bias.
+    - `tactics`: every tactic in the sentence. `phrase` must be the *exact*
+      substring; name the `tactic` (e.g. "Appeal to Fear", "Loaded Language",
+      "False Dichotomy"), give an `explanation` of how it works here, and a
+      `type` (e.g. 'Emotional Appeal', 'Logical Fallacy', 'Framing').
     """
     text: str = dspy.InputField(
         desc="The text to be analyzed sentence by sentence for bias and tactics."
@@ -66,25 +309,15 @@ class SentenceAnalysisSignature(dspy.Signature):
 
 class OmissionsAnalysisSignature(dspy.Signature):
     """
-    You are an investigative journalist and strategic analyst. Your task is to
-    identify the most significant omissions in a given text.
-
-    Think about what is NOT being said. What perspectives are missing? What crucial
-    data is absent? What counterarguments are conveniently ignored? An omission
-    is a gap in the narrative that, if filled, could significantly alter a
-    reader's perception.
-
-    Focus on identifying 3 to 5 major omissions by considering:
-    - **Missing Perspectives:** Which relevant stakeholders or affected groups have no voice?
-    - **Missing Data/Evidence:** What claims lack supporting evidence that should exist?
-    - **Missing Counterarguments:** What are the most compelling arguments against the
-      author's position that are not addressed?
-    - **Missing Context:** Is there historical, social, or economic context that is
-      left out, making the narrative misleading?
-    - **Missing Consequences:** Are potential negative outcomes or downsides of the
-      proposed ideas ignored?
-
-    For each omission, describe its potential impact on the reader's understanding.
+    Identify 3 to 5 significant omissions in a text: gaps that, if filled,
+    could alter a reader's perception. Look for missing:
+    - **Perspectives:** stakeholders or affected groups with no voice
+    - **Evidence:** claims lacking data that should exist
+    - **Counterarguments:** the strongest objections left unaddressed
+    - **Context:** historical, social or economic background left out
+    - **Consequences:** downsides of the proposed ideas that are ignored
+
+    Describe each omission's potential impact on the reader's understanding.
     """
     text: str = dspy.InputField(
         desc="The text to analyze for significant omissions."
@@ -94,101 +327,144 @@ class OmissionsAnalysisSignature(dspy.Signature):
     )
 
 
+class CombinedDeconstructionSignature(dspy.Signature):
+    """
+    Deconstruct a text in three parts:
+
+    **1. Foundational assumptions:** up to 6 unstated core beliefs that *must*
+    be true for the argument to hold (epistemological, metaphysical, ethical,
+    social/political). Skip surface-level claims.
+
+    **2. Sentence analysis:** EVERY sentence, with a `bias_score` from -1.0
+    (hostile) to 0.0 (neutral) to 1.0 (promotional), a `justification` quoting
+    the biased words, and all `tactics`: the *exact* `phrase`, the `tactic`
+    name (e.g. "Loaded Language"), an `explanation`, and a `type` (e.g.
+    'Emotional Appeal', 'Logical Fallacy', 'Framing').
+
+    **3. Omissions:** 3 to 5 gaps that could alter a reader's perception
+    (missing perspectives, evidence, counterarguments, context, consequences),
+    each with its potential impact.
+    """
+    text: str = dspy.InputField(
+        desc="The text to deconstruct."
+    )
+    assumptions_json: list[str] = dspy.OutputField(
+        desc="array of 3-5 core assumptions as strings: [\"assumption1\", \"assumption2\", ...]"
+    )
+    analysis_json: list[SynthesizedSentence] = dspy.OutputField(
+        desc="array of sentence analysis objects with structure: [{\"sentence\": \"...\", \"bias_score\": 0.0, \"justification\": \"...\", \"tactics\": [{\"phrase\": \"...\", \"tactic\": \"...\", \"explanation\": \"...\", \"type\": \"...\"}]}]"
+    )
+    omissions_json: list[Omission] = dspy.OutputField(
+        desc="array of omission objects: [{\"omitted_perspective\": \"...\", \"potential_impact\": \"...\"}]"
+    )
+
+
 class DeconstructionPipeline(dspy.Module):
     """
     DSPy module implementing narrative deconstruction.
     """
 
-    def __init__(self):
+    def __init__(self, pool: Optional[LLMPool] = None, split_signatures: bool = False,
+                 sentences_per_call: int = 15):
         super().__init__()
-        # Use Predict modules for reliable structured outputs
+        # Deployments to route async calls across; None uses the configured LM
+        self.pool = pool
+        # One LLM call per analysis instead of a single combined call; the
+        # combined call sends the text once, the split calls run in parallel
+        self.split_signatures = split_signatures
+        # With split signatures, longer texts get their sentence analysis in
+        # concurrent calls of this many sentences, so no single output
+        # outgrows the generation budget
+        self.sentences_per_call = sentences_per_call
+        self.combined_analysis = dspy.Predict(CombinedDeconstructionSignature)
+        # Use Predict modules for reliable structured outputs. The short
+        # outputs get a tighter generation budget than the LM's 4096 tokens,
+        # so a runaway generation stops early instead of running to the cap.
         self.foundational_assumptions = dspy.Predict(
-            FoundationalAssumptionsSignature)
+            FoundationalAssumptionsSignature, max_tokens=512)
         self.sentence_analysis = dspy.Predict(SentenceAnalysisSignature)
-        self.omissions_analysis = dspy.Predict(OmissionsAnalysisSignature)
+        self.omissions_analysis = dspy.Predict(
+            OmissionsAnalysisSignature, max_tokens=800)
 
-    def _process_assumptions(self, result) -> List[str]:
-        """Process assumptions output with fallback."""
-        if hasattr(result, 'assumptions_json'):
-            assumptions = result.assumptions_json
-            if isinstance(assumptions, list):
-                return assumptions
-            elif isinstance(assumptions, str):
-                return [assumptions]
-            else:
-                return [str(assumptions)]
-        return ["Analysis temporarily unavailable"]
+    # Each _process_* step returns its value and whether it came from the LM
+    # output as is (False when any of it is a fallback or placeholder), so
+    # degraded results are not reported, or cached, as complete. The
+    # LenientJSONAdapter hands the fields over already decoded: typed values
+    # when the whole output validated, plain JSON values when it did not,
+    # and None for a missing field.
 
-    def _process_sentence_analysis(self, result, original_text: str) -> List[SynthesizedSentence]:
+    def _process_assumptions(self, result) -> Tuple[List[str], bool]:
+        """Process assumptions output with fallback."""
+        assumptions = getattr(result, 'assumptions_json', None)
+        if isinstance(assumptions, list):
+            if assumptions:
+                if all(isinstance(assumption, str) for assumption in assumptions):
+                    return assumptions, True
+                return [str(assumption) for assumption in assumptions], False
+        elif isinstance(assumptions, str):
+            # Plain prose instead of an array is kept as a single assumption
+            return [assumptions], bool(assumptions.strip())
+        elif assumptions is not None:
+            return [str(assumptions)], False
+        return ["Analysis temporarily unavailable"], False
+
+    def _process_sentence_analysis(self, result, original_text: str
+                                   ) -> Tuple[List[SynthesizedSentence], bool]:
         """Process sentence analysis output with fallback."""
-        if hasattr(result, 'analysis_json'):
-            analysis_data = result.analysis_json
-
-            if isinstance(analysis_data, list):
-                sentences = []
-                for item in analysis_data:
-                    if isinstance(item, SynthesizedSentence):
-                        sentences.append(item)
-                    elif isinstance(item, dict):
-                        try:
-                            sentences.append(SynthesizedSentence(**item))
-                        except Exception as e:
-                            print(
-                                f"Warning: Invalid sentence analysis item: {e}")
-                            # Create a basic fallback sentence
-                            sentences.append(SynthesizedSentence(
-                                sentence=item.get(
-                                    'sentence', 'Unknown sentence'),
-                                bias_score=0.0,
-                                justification="Analysis format error",
-                                tactics=[]
-                            ))
-                return sentences
+        analysis_data = getattr(result, 'analysis_json', None)
+        if isinstance(analysis_data, list) and analysis_data:
+            try:
+                return _SENT_ADAPTER.validate_python(analysis_data), True
+            except ValidationError:
+                pass
+
+            # Some items are malformed: keep the valid ones as they are
+            coerced = map(_coerce_sentence, analysis_data)
+            return [sentence for sentence in coerced if sentence is not None], False
 
         # Fallback: create basic sentence breakdown
-        basic_sentences = [
-            s.strip() + '.' for s in original_text.split('.') if s.strip()]
-        return [
-            SynthesizedSentence(
-                sentence=sentence,
-                bias_score=0.0,
-                justification="Analysis temporarily unavailable",
-                tactics=[]
-            ) for sentence in basic_sentences[:5]
-        ]
+        return _unavailable_sentences(first_sentences(original_text, 5)), False
 
-    def _process_omissions(self, result) -> List[Omission]:
+    def _process_omissions(self, result) -> Tuple[List[Omission], bool]:
         """Process omissions output with fallback."""
-        if hasattr(result, 'omissions_json'):
-            omissions_data = result.omissions_json
-
-            if isinstance(omissions_data, list):
-                omissions = []
-                for item in omissions_data:
-                    if isinstance(item, Omission):
-                        omissions.append(item)
-                    elif isinstance(item, dict):
-                        try:
-                            omissions.append(Omission(**item))
-                        except Exception as e:
-                            print(f"Warning: Invalid omission item: {e}")
-                            # Create a basic fallback omission
-                            omissions.append(Omission(
-                                omitted_perspective=item.get(
-                                    'omitted_perspective', 'Unknown omission'),
-                                potential_impact="Analysis format error"
-                            ))
-                return omissions
+        omissions_data = getattr(result, 'omissions_json', None)
+        if isinstance(omissions_data, list) and omissions_data:
+            try:
+                return _OMISSION_ADAPTER.validate_python(omissions_data), True
+            except ValidationError:
+                pass
+
+            # Some items are malformed: keep the valid ones as they are
+            coerced = map(_coerce_omission, omissions_data)
+            return [omission for omission in coerced if omission is not None], False
 
         # Fallback omission
-        return [Omission(
-            omitted_perspective="Analysis temporarily unavailable",
-            potential_impact="Unable to identify omissions at this time"
-        )]
+        return [_UNAVAILABLE_OMISSION], False
+
+    def _build_response(self, assumptions_result, sentence_result, omissions_result,
+                        text: str, complete: bool) -> Dict[str, Any]:
+        """
+        Assemble the pipeline result from the three raw predictions.
+
+        ``complete`` is what the caller knows (no step raised); it is cleared
+        if any step had to fall back while processing its output.
+        """
+        assumptions, assumptions_ok = self._process_assumptions(assumptions_result)
+        sentences, sentences_ok = self._process_sentence_analysis(sentence_result, text)
+        omissions, omissions_ok = self._process_omissions(omissions_result)
+        return {
+            "foundational_assumptions": assumptions,
+            "synthesized_text": sentences,
+            "omissions": omissions,
+            "complete": complete and assumptions_ok and sentences_ok and omissions_ok
+        }
 
     def forward(self, text: str) -> Dict[str, Any]:
         """
-        Run the complete deconstruction pipeline synchronously.
+        Run the complete deconstruction pipeline from synchronous code.
+
+        The async service path uses ``aforward``; this is for scripts and
+        notebooks that call the pipeline directly.
 
         Args:
             text: The text to analyze.
@@ -197,20 +473,48 @@ class DeconstructionPipeline(dspy.Module):
             Dictionary with structured results from all three analysis steps.
         """
         try:
-            # Execute analyses sequentially for predictable results
-            assumptions_result = self.foundational_assumptions(text=text)
-            sentence_result = self.sentence_analysis(text=text)
-            omissions_result = self.omissions_analysis(text=text)
-
-            return {
-                "foundational_assumptions": self._process_assumptions(assumptions_result),
-                "synthesized_text": self._process_sentence_analysis(sentence_result, text),
-                "omissions": self._process_omissions(omissions_result)
-            }
+            if not self.split_signatures:
+                result = self._call(self.combined_analysis, text)
+                return self._build_response(result, result, result, text, complete=True)
+
+            # The three analyses are independent, so run them side by side.
+            # dspy.context overrides are thread-local, so the caller's LM is
+            # passed to the worker threads explicitly.
+            lm = dspy.settings.lm
+            predictors = (self.foundational_assumptions,
+                          self.sentence_analysis, self.omissions_analysis)
+            with ThreadPoolExecutor(max_workers=len(predictors)) as executor:
+                futures = [executor.submit(self._call, predictor, text, lm)
+                           for predictor in predictors]
+                assumptions_result, sentence_result, omissions_result = (
+                    future.result() for future in futures)
+
+            return self._build_response(
+                assumptions_result, sentence_result, omissions_result, text, complete=True)
 
         except Exception as e:
-            print(f"Error in DSPy pipeline forward: {e}")
-            return self._create_error_response(text, str(e))
+            logger.error("Error in DSPy pipeline forward: %s", e)
+            return error_response(text, str(e))
+
+    @staticmethod
+    @_llm_retry
+    def _call(predictor: dspy.Predict, text: str, lm: Optional[dspy.LM] = None):
+        """Run one predictor synchronously, retrying transient LLM errors."""
+        return predictor(text=text, lm=lm)
+
+    @_llm_retry
+    async def _acall(self, predictor: dspy.Predict, text: str):
+        """
+        Run one predictor, routed through the deployment pool if there is one.
+        Transient LLM errors are retried with jittered exponential backoff; the
+        pool slot is released while waiting, so a retry may use another deployment.
+        """
+        if self.pool is None:
+            return await predictor.acall(text=text)
+        # Pass the LM per call: dspy.context overrides are thread-local and
+        # would leak between the concurrent tasks of one event loop.
+        async with self.pool.acquire() as lm:
+            return await predictor.acall(text=text, lm=lm)
 
     async def aforward(self, text: str) -> Dict[str, Any]:
         """
@@ -220,65 +524,248 @@ class DeconstructionPipeline(dspy.Module):
             text: The text to analyze.
 
         Returns:
-            Dictionary with structured results from all three analysis steps.
+            Dictionary with structured results from all three analysis steps,
+            plus a ``complete`` flag that is False if any step failed.
         """
         try:
-            assumptions_task = self.foundational_assumptions.acall(text=text)
-            sentence_task = self.sentence_analysis.acall(text=text)
-            omissions_task = self.omissions_analysis.acall(text=text)
-
-            # Wait for all analyses to complete
-            assumptions_result, sentence_result, omissions_result = await asyncio.gather(
-                assumptions_task,
-                sentence_task,
-                omissions_task,
-                return_exceptions=True
-            )
-
-            # Handle any exceptions from individual analyses
-            if isinstance(assumptions_result, Exception):
-                print(f"Assumptions analysis failed: {assumptions_result}")
-                assumptions_result = type(
-                    'obj', (object,), {'assumptions_json': '[]'})()
-
-            if isinstance(sentence_result, Exception):
-                print(f"Sentence analysis failed: {sentence_result}")
-                sentence_result = type(
-                    'obj', (object,), {'analysis_json': '[]'})()
-
-            if isinstance(omissions_result, Exception):
-                print(f"Omissions analysis failed: {omissions_result}")
-                omissions_result = type(
-                    'obj', (object,), {'omissions_json': '[]'})()
-
-            return {
-                "foundational_assumptions": self._process_assumptions(assumptions_result),
-                "synthesized_text": self._process_sentence_analysis(sentence_result, text),
-                "omissions": self._process_omissions(omissions_result)
-            }
+            if self.split_signatures:
+                results, complete = await self._predict_split(text)
+            else:
+                results, complete = await self._predict_combined(text)
+
+            return self._build_response(*results, text, complete)
 
         except Exception as e:
-            print(f"Error in DSPy pipeline aforward: {e}")
-            return self._create_error_response(text, str(e))
-
-    def _create_error_response(self, text: str, error_message: str) -> Dict[str, Any]:
-        """Create a structured error response."""
-        # Basic sentence breakdown for error case
-        sentences = [s.strip() + '.' for s in text.split('.') if s.strip()]
-        error_sentences = [
-            SynthesizedSentence(
-                sentence=sentence,
-                bias_score=0.0,
-                justification=f"Analysis failed: {error_message}",
-                tactics=[]
-            ) for sentence in sentences[:3]
+            logger.error("Error in DSPy pipeline aforward: %s", e)
+            return error_response(text, str(e))
+
+    async def abatch(self, texts: List[str], max_concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Analyze several texts concurrently.
+
+        Args:
+            texts: The texts to analyze.
+            max_concurrency: Most texts analyzed at once. The deployment pool
+                still bounds the LLM calls underneath.
+
+        Returns:
+            One ``aforward`` result per text, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze(text: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aforward(text)
+
+        return await asyncio.gather(*(analyze(text) for text in texts))
+
+    async def _predict_split(self, text: str) -> Tuple[Tuple[Any, Any, Any], bool]:
+        """Run the three single-purpose predictors concurrently."""
+        assumptions_task = self._acall(self.foundational_assumptions, text)
+        sentence_task = self._analyze_sentences(text)
+        omissions_task = self._acall(self.omissions_analysis, text)
+
+        # Wait for all analyses to complete
+        assumptions_result, sentence_result, omissions_result = await asyncio.gather(
+            assumptions_task,
+            sentence_task,
+            omissions_task,
+            return_exceptions=True
+        )
+
+        complete = not any(isinstance(r, Exception) for r in (
+            assumptions_result, sentence_result, omissions_result))
+
+        # Handle any exceptions from individual analyses
+        if isinstance(assumptions_result, Exception):
+            logger.warning("Assumptions analysis failed: %s", assumptions_result)
+            assumptions_result = _EMPTY_RESULT
+
+        if isinstance(sentence_result, Exception):
+            logger.warning("Sentence analysis failed: %s", sentence_result)
+            sentence_result = _EMPTY_RESULT
+        else:
+            sentence_result, sentences_complete = sentence_result
+            complete = complete and sentences_complete
+
+        if isinstance(omissions_result, Exception):
+            logger.warning("Omissions analysis failed: %s", omissions_result)
+            omissions_result = _EMPTY_RESULT
+
+        return (assumptions_result, sentence_result, omissions_result), complete
+
+    async def _analyze_sentences(self, text: str) -> Tuple[Any, bool]:
+        """
+        Run sentence analysis over groups of ``sentences_per_call`` sentences
+        concurrently, merging the analyses back in order.
+
+        Returns:
+            The merged prediction, and whether every group was analyzed. A
+            group whose call failed, or whose output can't be parsed, is
+            replaced by placeholders for its own sentences, so the other
+            groups' analyses are kept.
+        """
+        groups = group_sentences(text, self.sentences_per_call)
+        if len(groups) == 1:
+            return await self._acall(self.sentence_analysis, text), True
+
+        results = await asyncio.gather(
+            *(self._acall(self.sentence_analysis, group) for group in groups),
+            return_exceptions=True)
+        analyses = []
+        complete = True
+        for group, result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.warning("Sentence analysis failed for one group: %s", result)
+                analyses.extend(_unavailable_sentences(iter_sentences(group)))
+                complete = False
+                continue
+            items = result.analysis_json
+            if isinstance(items, list):
+                analyses.extend(items)
+            else:
+                logger.warning("Unparseable sentence analysis for one group: %.200r",
+                               result.analysis_json)
+                analyses.extend(_unavailable_sentences(iter_sentences(group)))
+                complete = False
+        return dspy.Prediction(analysis_json=analyses), complete
+
+    async def _predict_combined(self, text: str) -> Tuple[Tuple[Any, Any, Any], bool]:
+        """Run the combined predictor; its result carries all three outputs."""
+        try:
+            result = await self._acall(self.combined_analysis, text)
+        except Exception as e:
+            logger.warning("Combined analysis failed: %s", e)
+            return (_EMPTY_RESULT, _EMPTY_RESULT, _EMPTY_RESULT), False
+        return (result, result, result), True
+
+    async def astream(self, text: str) -> AsyncIterator[Tuple[str, Any, bool]]:
+        """
+        Run the three analyses concurrently and yield each one as it finishes.
+
+        Args:
+            text: The text to analyze.
+
+        Yields:
+            ``(section, value, complete)`` triples in completion order, where
+            section is one of the keys of the ``aforward`` result and complete
+            is False if the value contains fallbacks. With split signatures
+            ``synthesized_text`` is yielded again each time another group of
+            sentences is analyzed, with all the sentences analyzed so far.
+            With a combined signature all three arrive together once the
+            single call is done.
+        """
+        if not self.split_signatures:
+            results, complete = await self._predict_combined(text)
+            response = self._build_response(*results, text, complete)
+            for section in ("foundational_assumptions", "synthesized_text", "omissions"):
+                yield section, response[section], response["complete"]
+            return
+
+        # Every producer puts its events on the queue, then None once done
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce_section(analyze, section: str, process) -> None:
+            try:
+                await queue.put(await self._run_section(text, section, analyze, process))
+            finally:
+                await queue.put(None)
+
+        async def produce_sentences() -> None:
+            try:
+                async for sentences, complete in self._stream_sentences(text):
+                    await queue.put(("synthesized_text", sentences, complete))
+            finally:
+                await queue.put(None)
+
+        tasks = [
+            asyncio.ensure_future(produce_section(
+                partial(self._acall, self.foundational_assumptions),
+                "foundational_assumptions", self._process_assumptions)),
+            asyncio.ensure_future(produce_sentences()),
+            asyncio.ensure_future(produce_section(
+                partial(self._acall, self.omissions_analysis),
+                "omissions", self._process_omissions)),
         ]
+        try:
+            pending = len(tasks)
+            while pending:
+                event = await queue.get()
+                if event is None:
+                    pending -= 1
+                else:
+                    yield event
+        finally:
+            # The consumer may stop early (e.g. the client disconnected)
+            for task in tasks:
+                task.cancel()
+
+    async def _stream_sentences(
+            self, text: str) -> AsyncIterator[Tuple[List[SynthesizedSentence], bool]]:
+        """
+        Analyze the sentence groups concurrently, yielding the analyzed
+        sentences so far, and whether all of them were analyzed without
+        fallbacks, each time the next group in text order is done.
+        """
+        groups = group_sentences(text, self.sentences_per_call)
+        tasks = [asyncio.ensure_future(self._acall(self.sentence_analysis, group))
+                 for group in groups]
+        sentences: List[SynthesizedSentence] = []
+        complete = True
+        try:
+            for group, task in zip(groups, tasks):
+                try:
+                    result = await task
+                except Exception as e:
+                    logger.warning("Sentence analysis failed for one group: %s", e)
+                    sentences.extend(_unavailable_sentences(iter_sentences(group)))
+                    complete = False
+                else:
+                    analyzed, ok = self._process_sentence_analysis(result, group)
+                    sentences.extend(analyzed)
+                    complete = complete and ok
+                yield list(sentences), complete
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_section(self, text: str, section: str, analyze,
+                           process) -> Tuple[str, Any, bool]:
+        """Run one analysis step, falling back to the empty result on failure."""
+        try:
+            result = await analyze(text)
+        except Exception as e:
+            logger.warning("%s analysis failed: %s", section, e)
+            result = _EMPTY_RESULT
+        value, complete = process(result)
+        return section, value, complete
 
-        return {
-            "foundational_assumptions": [f"Analysis failed: {error_message}"],
-            "synthesized_text": error_sentences,
-            "omissions": [Omission(
-                omitted_perspective="Analysis unavailable due to error",
-                potential_impact=f"System error prevented analysis: {error_message}"
-            )]
-        }
+
+def error_response(text: str, error_message: str) -> Dict[str, Any]:
+    """
+    Build the placeholder result returned when an analysis fails outright.
+
+    Args:
+        text: The text that was being analyzed.
+        error_message: Description of the failure, shown in every section.
+
+    Returns:
+        Dictionary shaped like a pipeline result, with ``complete`` set to False
+        and a basic breakdown of the first sentences of ``text``.
+    """
+    justification = f"Analysis failed: {error_message}"
+    error_sentences = [
+        _DEFAULT_SENTENCE.model_copy(update={
+            "sentence": sentence, "justification": justification})
+        for sentence in first_sentences(text, 3)
+    ]
+
+    return {
+        "complete": False,
+        "foundational_assumptions": [f"Analysis failed: {error_message}"],
+        "synthesized_text": error_sentences,
+        "omissions": [_DEFAULT_OMISSION.model_copy(update={
+            "omitted_perspective": "Analysis unavailable due to error",
+            "potential_impact": f"System error prevented analysis: {error_message}"
+        })]
+    }
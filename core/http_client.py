@@ -0,0 +1,27 @@
+"""
+Shared outbound HTTP client for LLM calls.
+"""
+
+import httpx
+import litellm
+
+# One pooled client for every LiteLLM request, so TCP/TLS connections to
+# Azure OpenAI are reused across requests and deployments. HTTP/2 multiplexes
+# concurrent calls over a few connections instead of one per in-flight call.
+client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100,
+                        keepalive_expiry=60.0),
+    # Fail fast on unreachable endpoints; long generations still get time
+    timeout=httpx.Timeout(120.0, connect=5.0)
+)
+
+
+def install() -> None:
+    """Route LiteLLM's async requests through the shared client."""
+    litellm.aclient_session = client
+
+
+async def aclose() -> None:
+    """Close the shared client's connections on application shutdown."""
+    await client.aclose()
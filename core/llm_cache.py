@@ -0,0 +1,90 @@
+"""
+Exact-match cache for analysis results.
+"""
+
+import time
+import asyncio
+import xxhash
+import diskcache
+from collections import OrderedDict
+from typing import Any, Optional, Protocol, Tuple
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache; implementations may be local or shared."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU with an optional per-entry time to live."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class DiskCacheBackend:
+    """
+    Persistent cache in a local directory, shared by every worker process on
+    the machine and kept across restarts.
+    """
+
+    def __init__(self, directory: str, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self._cache = diskcache.Cache(directory)
+
+    # diskcache does blocking SQLite and file I/O, so it runs in a thread
+    async def get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._cache.get, key)
+
+    async def set(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self._cache.set, key, value, expire=self.ttl)
+
+
+class LLMCache:
+    """
+    Caches LLM-derived results by an exact digest of what produced them.
+
+    Only safe for deterministic calls (temperature 0), where the same model
+    and input always yield the same output.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Digest of the key parts; callers normalize them first."""
+        return xxhash.xxh3_128_hexdigest("\x1f".join(parts).encode())
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.backend.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.backend.set(key, value)
@@ -0,0 +1,65 @@
+"""
+Routing of LLM calls across one or more Azure OpenAI deployments.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncIterator, List, Optional, Tuple
+import dspy
+
+
+class _PoolEntry:
+    """A single deployment's LM together with its concurrency bookkeeping."""
+
+    __slots__ = ("lm", "capacity", "semaphore", "in_flight")
+
+    def __init__(self, lm: dspy.LM, capacity: int):
+        self.lm = lm
+        self.capacity = capacity
+        self.semaphore = asyncio.Semaphore(capacity)
+        self.in_flight = 0
+
+
+class LLMPool:
+    """
+    Spreads LM calls across deployments so each one's rate quota is used in
+    parallel instead of queuing every call behind a single deployment.
+
+    Each deployment gets its own semaphore sized to its ``max_concurrency``,
+    and a call is routed to the deployment with the lowest load relative to
+    that capacity. ``max_total_concurrency`` additionally caps calls across
+    all deployments, so bursts queue here instead of turning into 429s.
+    """
+
+    def __init__(self, deployments: List[Tuple[dspy.LM, int]],
+                 max_total_concurrency: Optional[int] = None):
+        if not deployments:
+            raise ValueError("LLMPool needs at least one deployment")
+        self._entries = [_PoolEntry(lm, capacity)
+                         for lm, capacity in deployments]
+        self._total = (asyncio.Semaphore(max_total_concurrency)
+                       if max_total_concurrency else None)
+
+    @property
+    def lms(self) -> List[dspy.LM]:
+        """The LMs in the pool, in configuration order."""
+        return [entry.lm for entry in self._entries]
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[dspy.LM]:
+        """Reserve a slot on the least-loaded deployment and yield its LM."""
+        # Pick the deployment only once a global slot is free, so the choice
+        # reflects the load at the time the call actually starts
+        async with self._total or nullcontext():
+            async with self._acquire_entry() as lm:
+                yield lm
+
+    @asynccontextmanager
+    async def _acquire_entry(self) -> AsyncIterator[dspy.LM]:
+        entry = min(self._entries, key=lambda e: e.in_flight / e.capacity)
+        entry.in_flight += 1
+        try:
+            async with entry.semaphore:
+                yield entry.lm
+        finally:
+            entry.in_flight -= 1
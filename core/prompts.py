@@ -1,127 +0,0 @@
-# DEPRECATED: This file contains legacy prompts that are no longer used.
-# The application has been refactored to use DSPy signatures and modules
-# which provide a more programmatic approach to prompt engineering.
-# This file is kept for reference only.
-
-# Simplified prompts for multi-step analysis approach
-
-FOUNDATIONAL_ASSUMPTIONS_PROMPT = """
-You are an expert in critical thinking and epistemology. Your task is to identify the core, unstated assumptions that an author must believe for their text to be coherent.
-
-Analyze the following text and identify 3-5 foundational assumptions that the author takes for granted. Focus on beliefs about reality, society, human nature, or the topic at hand that the author assumes the reader will also accept.
-
-Return your response as a valid JSON object with this exact structure:
-{
-    "foundational_assumptions": [
-        "assumption 1",
-        "assumption 2",
-        "assumption 3"
-    ]
-}
-
-Text to analyze:
-"""
-
-SENTENCE_ANALYSIS_PROMPT = """
-You are an expert in rhetoric and bias detection. Analyze each sentence in the given text for bias and persuasive tactics.
-
-For each sentence, provide:
-1. A bias score from -1.0 (highly negative/critical) to 1.0 (highly positive/promotional), with 0.0 being neutral
-2. A brief justification for the score
-3. Any rhetorical tactics found in that sentence
-
-Tactics can be:
-- "Loaded Language" (emotional framing, charged words)
-- "Sales Tactics" (urgency, social proof, authority appeals)
-
-Return your response as a valid JSON object with this exact structure:
-{
-    "sentence_analysis": [
-        {
-            "sentence": "exact sentence text",
-            "bias_score": 0.0,
-            "justification": "brief explanation",
-            "tactics": [
-                {
-                    "phrase": "exact phrase",
-                    "tactic": "Loaded Language",
-                    "explanation": "how this works",
-                    "type": "emotional"
-                }
-            ]
-        }
-    ]
-}
-
-Text to analyze:
-"""
-
-OMISSIONS_ANALYSIS_PROMPT = """
-You are an expert in critical analysis and perspective-taking. Your task is to identify what important viewpoints, evidence, or counterarguments are missing from a text.
-
-Analyze the text and identify 3-5 major omissions in these categories:
-- Stakeholder perspectives that are missing
-- Data, evidence, or sources that would strengthen claims
-- Reasonable counterarguments that aren't addressed
-
-Return your response as a valid JSON object with this exact structure:
-{
-    "omissions": [
-        {
-            "omitted_perspective": "description of missing viewpoint",
-            "potential_impact": "how this omission affects understanding"
-        }
-    ]
-}
-
-Text to analyze:
-"""
-
-# Legacy prompt kept for reference (can be removed later)
-SYNTHESIS_PROMPT_LEGACY = """
-You are a master deconstructionist and epistemological auditor. Your task is to perform a multi-layered, deeply critical synthesis of a given text. You must analyze the text's structure, its explicit arguments, and its implicit assumptions.
-
-IMPORTANT: Keep your analysis concise and focused. Limit foundational assumptions to 3-5 key points. For longer texts, focus on the most significant sentences and tactics.
-
-Your analysis must proceed in the following order:
-
-### Part 1: Foundational Assumptions
-First, before any other analysis, identify the core, unstated assumptions the author must believe for the text to be coherent. What does the author take for granted that the reader will also accept? (Limit to 3-5 assumptions)
-
-### Part 2: Sentence-by-Sentence Analysis
-Next, break the text down into its individual sentences. For EACH sentence, you must perform the following analysis:
-1.  **Bias Score**: Assign a bias score from -1.0 (highly negative/critical) to 1.0 (highly positive/promotional), with 0.0 being neutral. Provide a brief justification for this score.
-2.  **Tactic Identification**: Within that same sentence, identify any specific rhetorical or manipulative tactics. These can be 'Loaded Language' (e.g., framing, emotional language) or 'Sales Tactics' (e.g., urgency, social proof). For each tactic found, specify the exact phrase, its name, and an explanation.
-
-### Part 3: Holistic Omission Analysis
-After analyzing the sentences, perform a final, holistic analysis of what is missing. To do this, first state the text's central claim in one sentence. Then, identify major omissions in the following categories (limit to 3-5 total omissions):
--   **Stakeholder Omissions**: Whose perspective is missing (e.g., customers, employees, marginalized groups, the environment)?
--   **Data & Evidence Omissions**: What statistics, studies, or sources would be needed to truly validate the author's claims?
--   **Counter-Argument Omissions**: What is the strongest reasonable argument against the author's position that is not addressed?
-
-### JSON Output Structure
-Your response MUST be a single, valid JSON object and nothing else. Do not include any explanatory text outside this structure. The JSON object must have three top-level keys: "foundational_assumptions", "synthesized_text", and "omissions".
-
-CRITICAL JSON FORMATTING RULES:
-- Use double quotes for all strings, never single quotes
-- Escape any double quotes inside strings with \"
-- Do not include trailing commas after the last item in arrays or objects
-- Ensure all brackets and braces are properly matched
-- Keep string values concise to avoid JSON parsing issues
-
--   `"foundational_assumptions"`: An array of strings, where each string is a core unstated assumption.
--   `"synthesized_text"`: An array of objects, where each object represents a sentence and contains exactly these keys:
-    * "sentence" (string): The exact sentence text
-    * "bias_score" (float): A number between -1.0 and 1.0
-    * "justification" (string): Brief explanation of the bias score (keep under 200 characters)
-    * "tactics" (array): Array of tactic objects, each containing:
-      - "phrase" (string): The exact phrase from the sentence
-      - "tactic" (string): Name of the tactic (e.g., "Loaded Language", "Sales Tactics")
-      - "explanation" (string): How this tactic works (keep under 150 characters)
-      - "type" (string): Category of the tactic (e.g., "framing", "urgency")
--   `"omissions"`: An array of objects, where each object has exactly these keys:
-    * "omitted_perspective" (string): Description of the missing viewpoint (keep under 200 characters)
-    * "potential_impact" (string): How this omission affects understanding (keep under 200 characters)
-
-This structure is mandatory. Ensure your output is a single, complete JSON object with exactly these field names. Double-check that your JSON is valid before responding.
-"""
@@ -0,0 +1,119 @@
+"""
+Text helpers shared by the pipeline and the analysis service.
+"""
+
+import re
+import logging
+import itertools
+import tiktoken
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Characters per token assumed when the tokenizer is unavailable. English
+# averages about 4 with o200k_base; erring low keeps chunks within budget.
+_CHARS_PER_TOKEN = 3
+
+# A sentence runs lazily up to its closing terminators, which only count when
+# followed by whitespace and a non-lowercase character (or the end of the
+# text). Decimals like "3.14", mid-sentence "e.g. this" and common titles
+# like "Dr. Smith" stay intact.
+_SENT_RE = re.compile(
+    r'\S.*?(?:(?<!\bDr)(?<!\bMr)(?<!\bMs)(?<!\bMrs)(?<!\bSt)(?<!\bvs)'
+    r'[.!?]+(?=\s+[^a-z\s]|\s*\Z)|\Z)', re.S)
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """Yield the sentences of ``text`` one at a time, stripped."""
+    return (m.group().strip() for m in _SENT_RE.finditer(text))
+
+
+def first_sentences(text: str, n: int) -> List[str]:
+    """
+    Return up to ``n`` leading sentences of ``text``.
+
+    Sentences are matched lazily, so only the first ``n`` are materialized no
+    matter how long the text is.
+    """
+    return list(itertools.islice(iter_sentences(text), n))
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Optional[tiktoken.Encoding]:
+    """
+    The tokenizer of the GPT-4o model family, loaded on first use.
+
+    Loading downloads the encoding unless it is cached locally; if that
+    fails, None is returned (and remembered) and token counts are estimated
+    from the text length instead.
+    """
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("Tokenizer unavailable, estimating token counts from length: %s", e)
+        return None
+
+
+def _token_counter() -> Callable[[str], int]:
+    """Count tokens with the tokenizer, or estimate them without it."""
+    encoding = _encoding()
+    if encoding is None:
+        return lambda text: -(-len(text) // _CHARS_PER_TOKEN)
+    return lambda text: len(encoding.encode(text))
+
+
+def group_sentences(text: str, size: int) -> List[str]:
+    """
+    Split ``text`` into consecutive groups of up to ``size`` sentences.
+
+    Returns:
+        The groups joined back into strings; ``[text]`` when it has no more
+        than ``size`` sentences.
+    """
+    sentences = iter_sentences(text)
+    groups = []
+    while group := list(itertools.islice(sentences, size)):
+        groups.append(" ".join(group))
+    return groups if len(groups) > 1 else [text]
+
+
+def load_tokenizer() -> None:
+    """Load the tokenizer now rather than on the first long text."""
+    _encoding()
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """
+    Split ``text`` into chunks of at most ``max_tokens`` tokens, breaking only
+    between sentences. A single sentence longer than the budget becomes a
+    chunk of its own.
+
+    Args:
+        text: The text to split.
+        max_tokens: Token budget per chunk.
+
+    Returns:
+        The chunks in order; just ``[text]`` when it fits the budget.
+    """
+    # Every token covers at least one byte, so short texts skip tokenizing
+    if len(text.encode()) <= max_tokens:
+        return [text]
+    count_tokens = _token_counter()
+    if count_tokens(text) <= max_tokens:
+        return [text]
+
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence in iter_sentences(text):
+        # +1 for the space the sentence is joined with
+        tokens = count_tokens(sentence) + 1
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += tokens
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
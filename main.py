@@ -1,19 +1,50 @@
 # This is the main entry point that ties everything together.
+import os
+import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from api.v1 import analyze
+from core import config, http_client
+from services.analyzer import init_pipeline, warm_up
 
-app = FastAPI(title="Narrative Deconstruction Toolkit API", version="6.0.0")
+# Application modules log through the logging module; configure the root
+# logger once here so their records reach stderr alongside uvicorn's
+logging.basicConfig(level=logging.INFO,
+                    format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build and warm up the analysis pipeline on startup and release pooled
+    outbound connections when the server shuts down.
+    """
+    init_pipeline()
+    await warm_up()
+    yield
+    await http_client.aclose()
+
+
+# ORJSONResponse serializes responses with orjson instead of the stdlib encoder
+app = FastAPI(title="Narrative Deconstruction Toolkit API", version="6.0.0",
+              default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Configure CORS - restricting to localhost for development. Only the
+# headers the frontend actually sends are allowed.
+ALLOWED_ORIGINS = frozenset(
+    ("http://localhost:8000", "http://127.0.0.1:8000", "http://0.0.0.0:8000"))
+ALLOWED_METHODS = ("GET", "POST")
+ALLOWED_HEADERS = ("content-type", "authorization")
 
-# Configure CORS - restricting to localhost for development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:8000", "http://127.0.0.1:8000", "http://0.0.0.0:8000"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
+    allow_methods=ALLOWED_METHODS,
+    allow_headers=ALLOWED_HEADERS,
 )
 
 # Include the unified API router
@@ -25,16 +56,30 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "message": "Narrative Deconstruction Toolkit API V6 - Synthesis Engine is running"}
 
-# Serve the main HTML file at root
-app.mount("/", StaticFiles(directory=".", html=True), name="html")
+# The page lives next to this module, wherever the server is started from.
+# It is the only file served: a static mount of this directory would expose
+# the source, .env and .git as well.
+_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.html")
+
+
+@lru_cache(maxsize=1)
+def _index_stat() -> os.stat_result:
+    """index.html only changes on deploy, so stat it once, on first request."""
+    return os.stat(_INDEX_PATH)
 
 
 @app.get("/")
 async def read_root():
     """Serve the main HTML file."""
-    return FileResponse("./index.html")
+    # In debug mode the page may be edited while the server runs
+    stat_result = None if config.DEBUG else _index_stat()
+    return FileResponse(_INDEX_PATH, stat_result=stat_result)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000,
-                reload=True, log_level="info")
+    # uvloop and httptools are in requirements.txt; name them explicitly so a
+    # missing install fails loudly instead of falling back to asyncio/h11
+    uvicorn.run("main:app", host=config.HOST, port=config.PORT,
+                loop="uvloop", http="httptools",
+                workers=config.WEB_CONCURRENCY,
+                reload=config.DEBUG, log_level="info")
@@ -1,8 +1,14 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, Tuple
 
 
+# from_attributes lets model_validate accept objects as well as dicts, e.g.
+# outputs that arrive as attribute-style objects rather than JSON. Analysis
+# models are frozen, so shared instances (cached results, dummy data) and
+# model_copy templates are safe.
 class EmbeddedTactic(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     phrase: str
     tactic: str  # e.g., 'Loaded Language', 'Sales Tactic'
     explanation: str
@@ -10,21 +16,41 @@ class EmbeddedTactic(BaseModel):
 
 
 class SynthesizedSentence(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     sentence: str
     bias_score: float = Field(..., ge=-1.0, le=1.0)
     justification: str
-    tactics: List[EmbeddedTactic]
+    # A tuple, so frozen sentences are immutable all the way down
+    tactics: Tuple[EmbeddedTactic, ...] = ()
+
+    @field_validator("bias_score", mode="before")
+    @classmethod
+    def _clamp_bias_score(cls, value):
+        """LMs occasionally overshoot the scale; clamp instead of rejecting."""
+        try:
+            return min(1.0, max(-1.0, float(value)))
+        except (TypeError, ValueError):
+            return value  # Left for the float validation to report
 
 
 class Omission(BaseModel):
-    omitted_perspective: str
-    potential_impact: str
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    # LMs sometimes shorten the key names; accept the common variants
+    omitted_perspective: str = Field(validation_alias=AliasChoices(
+        "omitted_perspective", "perspective", "missing_perspective", "omission"))
+    potential_impact: str = Field(validation_alias=AliasChoices(
+        "potential_impact", "impact"))
 
 
 class SynthesisResult(BaseModel):
-    foundational_assumptions: List[str]
-    synthesized_text: List[SynthesizedSentence]
-    omissions: Optional[List[Omission]] = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    # Tuples, so a shared result can't be changed through its sections either
+    foundational_assumptions: Tuple[str, ...]
+    synthesized_text: Tuple[SynthesizedSentence, ...]
+    omissions: Optional[Tuple[Omission, ...]] = None
 
 
 class SynthesisRequest(BaseModel):
@@ -1,53 +1,170 @@
 import dspy
 import asyncio
-from core import config
-from core.dspy_program import DeconstructionPipeline
-from models.analysis import SynthesisResult, SynthesizedSentence, Omission
-from services.dummy_data import get_dummy_synthesis_result, get_dummy_simple_result
-from typing import List
+import logging
+import threading
+from core import config, http_client
+from core.dspy_program import (
+    PROMPT_VERSION, DeconstructionPipeline, LenientJSONAdapter, error_response)
+from core.llm_cache import DiskCacheBackend, LLMCache, MemoryCacheBackend
+from core.llm_pool import LLMPool
+from core.text_utils import chunk_text, load_tokenizer
+from models.analysis import SynthesisResult
+from services.dummy_data import get_dummy_result, get_dummy_synthesis_results
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-def _configure_dspy() -> None:
+
+def _build_lm(deployment_name: str, api_key: str, api_base: str, api_version: str) -> dspy.LM:
+    """Create a DSPy LM for a single Azure OpenAI deployment."""
+    return dspy.LM(
+        model=f"azure/{deployment_name}",
+        api_key=api_key,
+        api_base=api_base,
+        api_version=api_version,
+        max_tokens=4096,
+        temperature=0.0,
+        # Transient errors are retried by the pipeline, outside the pool slot
+        num_retries=0,
+        # JSON mode: the API guarantees a bare JSON object, no markdown fences
+        response_format={"type": "json_object"}
+    )
+
+
+def _configure_dspy() -> LLMPool:
     """
     Configure DSPy with Azure OpenAI settings.
     This ensures proper LM configuration for the current context.
+
+    Returns:
+        An LLMPool over the primary deployment and any extra deployments
+        listed in AZURE_OPENAI_DEPLOYMENTS.
     """
     try:
-        lm = dspy.LM(
-            model=f"azure/{config.AZURE_OPENAI_DEPLOYMENT_NAME}",
-            api_key=config.AZURE_OPENAI_KEY,
-            api_base=config.AZURE_OPENAI_ENDPOINT,
-            api_version=config.AZURE_OPENAI_API_VERSION,
-            max_tokens=4096,
-            temperature=0.0
+        http_client.install()
+
+        lm = _build_lm(
+            config.AZURE_OPENAI_DEPLOYMENT_NAME,
+            config.AZURE_OPENAI_KEY,
+            config.AZURE_OPENAI_ENDPOINT,
+            config.AZURE_OPENAI_API_VERSION
         )
 
-        dspy.settings.configure(lm=lm)
-        print("DSPy configured successfully with Azure OpenAI")
+        # JSONAdapter asks for (and parses) a JSON object of the output fields,
+        # matching the JSON mode set on every LM; the lenient one keeps the
+        # valid items of an output that fails validation
+        dspy.settings.configure(lm=lm, adapter=LenientJSONAdapter())
+
+        deployments = [(lm, config.AZURE_OPENAI_MAX_CONCURRENCY)]
+        for deployment in config.AZURE_OPENAI_DEPLOYMENTS:
+            deployments.append((_build_lm(
+                deployment.deployment_name,
+                deployment.api_key or config.AZURE_OPENAI_KEY,
+                deployment.endpoint or config.AZURE_OPENAI_ENDPOINT,
+                deployment.api_version or config.AZURE_OPENAI_API_VERSION
+            ), deployment.max_concurrency))
+
+        logger.info(
+            "DSPy configured successfully with %d Azure OpenAI deployment(s)", len(deployments))
+        return LLMPool(deployments, config.MAX_CONCURRENT_LLM_CALLS)
 
     except Exception as e:
-        print(f"Error configuring DSPy: {e}")
+        logger.error("Error configuring DSPy: %s", e)
         raise
 
 
-# Global pipeline instance (created after configuration)
-_pipeline = None
+_pipeline: Optional[DeconstructionPipeline] = None
+# Guards the first build, so concurrent first calls from worker threads
+# configure DSPy exactly once
+_pipeline_lock = threading.Lock()
 
 
 def _get_pipeline() -> DeconstructionPipeline:
-    """Get or create the global pipeline instance."""
+    """
+    Get the process-wide pipeline instance, configuring DSPy on first use.
+    The Predict modules and LMs are built once and reused by every request.
+    """
     global _pipeline
     if _pipeline is None:
-        _configure_dspy()
-        _pipeline = DeconstructionPipeline()
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = DeconstructionPipeline(
+                    pool=_configure_dspy(),
+                    split_signatures=config.SPLIT_SIGNATURES,
+                    sentences_per_call=config.SENTENCES_PER_CALL)
     return _pipeline
 
 
+def init_pipeline() -> None:
+    """
+    Build the pipeline ahead of the first request, so that request doesn't
+    pay for configuring DSPy. A no-op with dummy data, which never uses it.
+    """
+    if not config.USE_DUMMY_DATA:
+        _get_pipeline()
+
+
+# A one-token prompt; JSON mode is switched off since it requires the word
+# "json" in the messages
+_WARM_UP_MESSAGES = [{"role": "user", "content": "ok"}]
+
+
+async def warm_up(timeout: float = 10.0) -> None:
+    """
+    Make one tiny uncached completion per deployment and load the tokenizer,
+    so TLS handshakes, LiteLLM's lazy setup and the tokenizer download are
+    done before the first real request. Failures are only logged; real
+    requests will surface any lasting problem.
+    """
+    if config.USE_DUMMY_DATA:
+        return
+    lms = _get_pipeline().pool.lms
+    results = await asyncio.gather(
+        # The download thread can't be cancelled, but startup stops waiting
+        asyncio.wait_for(asyncio.to_thread(load_tokenizer), timeout),
+        *(asyncio.wait_for(lm.acall(messages=_WARM_UP_MESSAGES, max_tokens=1,
+                                    cache=False, response_format=None), timeout)
+          for lm in lms),
+        return_exceptions=True
+    )
+    for name, result in zip(["tokenizer"] + [lm.model for lm in lms], results):
+        if isinstance(result, BaseException):
+            logger.warning("Warm-up of %s failed: %r", name, result)
+
+
+# Completed analyses keyed by model, prompts and normalized input text. Every
+# LM runs at temperature 0, so a repeated text would get the same analysis
+# anyway. With RESPONSE_CACHE_DIR set they persist on disk across restarts.
+_result_cache = LLMCache(
+    DiskCacheBackend(config.RESPONSE_CACHE_DIR, config.RESPONSE_CACHE_TTL or None)
+    if config.RESPONSE_CACHE_DIR else
+    MemoryCacheBackend(config.RESPONSE_CACHE_SIZE, config.RESPONSE_CACHE_TTL or None))
+
+
+def _cache_key(text: str) -> str:
+    """Result cache key for a text analyzed by the configured model and prompts."""
+    # Everything that shapes the result is part of the key, since a disk
+    # cache outlives configuration changes
+    return LLMCache.make_key(
+        config.AZURE_OPENAI_DEPLOYMENT_NAME,
+        PROMPT_VERSION,
+        f"split/{config.SENTENCES_PER_CALL}" if config.SPLIT_SIGNATURES else "combined",
+        str(config.MAX_CHUNK_TOKENS),
+        text.strip())
+
+
+# Analyses currently running, keyed like the result cache, so concurrent
+# requests for the same text share a single pipeline run
+_in_flight: "Dict[str, asyncio.Task[SynthesisResult]]" = {}
+
+
 async def run_synthesis_analysis(text: str) -> SynthesisResult:
     """
     Runs the DSPy-based deconstruction analysis pipeline asynchronously.
 
     If USE_DUMMY_DATA is True, returns dummy data instead of making LLM calls.
+    Completed analyses are cached in memory, so repeated texts skip the LLM,
+    and concurrent requests for the same text wait on one shared run.
 
     Uses DSPy's native async support with the latest version (2.6.27+)
     which includes proper acall() methods and asyncify utility.
@@ -61,57 +178,211 @@ async def run_synthesis_analysis(text: str) -> SynthesisResult:
 
     # Check if dummy data should be used
     if config.USE_DUMMY_DATA:
-        print("Using dummy data instead of LLM analysis...")
+        logger.info("Using dummy data instead of LLM analysis")
+        return get_dummy_result(text)
 
-        # Return comprehensive dummy data for the default example text
-        # or simpler dummy data for other inputs
-        if "Every country, every piece of land" in text:
-            return get_dummy_synthesis_result(text)
-        else:
-            return get_dummy_simple_result(text)
+    key = _cache_key(text)
+    cached = await _result_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_analyze(text, key))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+    # Shield so one caller disconnecting doesn't cancel the run for the others
+    return await asyncio.shield(task)
+
+
+async def run_batch_synthesis_analysis(texts: List[str]) -> List[SynthesisResult]:
+    """
+    Runs the analysis for several texts concurrently.
+
+    With dummy data the results are returned directly. Otherwise each text
+    goes through run_synthesis_analysis, so the result cache and shared
+    in-flight runs apply per text. At most BATCH_MAX_CONCURRENCY texts are
+    analyzed at once.
+
+    Args:
+        texts: The texts to analyze
+
+    Returns:
+        One SynthesisResult per text, in input order
+    """
+    if config.USE_DUMMY_DATA:
+        logger.info("Using dummy data instead of LLM analysis")
+        return get_dummy_synthesis_results(texts)
+
+    semaphore = asyncio.Semaphore(config.BATCH_MAX_CONCURRENCY)
+
+    async def analyze(text: str) -> SynthesisResult:
+        async with semaphore:
+            return await run_synthesis_analysis(text)
 
+    return await asyncio.gather(*(analyze(text) for text in texts))
+
+
+async def _analyze(text: str, key: str) -> SynthesisResult:
+    """Run the pipeline for one text and cache the result if it is complete."""
     try:
-        print("Starting async DSPy analysis with native support...")
+        logger.info("Starting async DSPy analysis")
 
         # Get the configured pipeline
         pipeline = _get_pipeline()
 
-        # Use the pipeline's native aforward method for async execution
-        # This leverages DSPy 2.6+ async capabilities
-        result = await pipeline.aforward(text=text)
+        # Long texts are analyzed as concurrent chunks and merged; one call
+        # over the whole text would overrun the model's useful context.
+        # Tokenizing is CPU-bound; keep it off the event loop
+        chunks = await asyncio.to_thread(chunk_text, text, config.MAX_CHUNK_TOKENS)
+        if len(chunks) == 1:
+            result = await pipeline.aforward(text=text)
+        else:
+            logger.info("Analyzing long text in %d chunks", len(chunks))
+            result = _merge_results(await pipeline.abatch(chunks, config.BATCH_MAX_CONCURRENCY))
+        complete = result.pop("complete", False)
 
         # Convert to SynthesisResult Pydantic model
-        synthesis_result = SynthesisResult(**result)
+        synthesis_result = SynthesisResult.model_validate(result)
 
-        print("Successfully completed async DSPy analysis")
+        # Only cache full successes so transient failures are retried
+        if complete:
+            await _result_cache.set(key, synthesis_result)
+
+        logger.info("Successfully completed async DSPy analysis")
         return synthesis_result
 
     except Exception as e:
-        print(f"Error during DSPy synthesis analysis: {e}")
+        logger.error("Error during DSPy synthesis analysis: %s", e)
         return _create_error_response(text, str(e))
 
 
+def _normalized(value: str) -> str:
+    """Case- and whitespace-insensitive form of a string, for deduplication."""
+    return " ".join(value.split()).casefold()
+
+
+def _merge_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the pipeline results of consecutive chunks of one text.
+
+    Sentence analyses are concatenated in order; assumptions and omissions
+    repeated across chunks are kept once.
+    """
+    assumptions = {}
+    omissions = {}
+    for result in results:
+        for assumption in result["foundational_assumptions"]:
+            assumptions.setdefault(_normalized(assumption), assumption)
+        for omission in result["omissions"]:
+            omissions.setdefault(_normalized(omission.omitted_perspective), omission)
+
+    return {
+        "foundational_assumptions": list(assumptions.values()),
+        "synthesized_text": [sentence for result in results
+                             for sentence in result["synthesized_text"]],
+        "omissions": list(omissions.values()),
+        "complete": all(result["complete"] for result in results)
+    }
+
+
+async def stream_synthesis_analysis(text: str) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Runs the analysis and yields each section as soon as it is ready.
+
+    With dummy data or the combined signature all three sections come from
+    one call anyway, so the text goes through run_synthesis_analysis (result
+    cache, shared in-flight runs) and the sections are yielded together.
+    With split signatures, cached results, runs already in flight and
+    chunked long texts are yielded at once; otherwise sections arrive in the
+    order the LLM calls finish. The streamed run is registered as in flight
+    like any other, so concurrent requests for the same text wait on it
+    instead of repeating the LLM calls.
+
+    Args:
+        text: The text to analyze
+
+    Yields:
+        (section, value) pairs keyed like the SynthesisResult fields
+    """
+    if config.USE_DUMMY_DATA or not config.SPLIT_SIGNATURES:
+        result = await run_synthesis_analysis(text)
+    else:
+        key = _cache_key(text)
+        result = await _result_cache.get(key)
+        if result is None and key not in _in_flight:
+            try:
+                # Tokenizing a long text is CPU-bound; keep it off the event loop
+                chunks = await asyncio.to_thread(chunk_text, text, config.MAX_CHUNK_TOKENS)
+            except Exception as e:
+                logger.error("Error during DSPy synthesis analysis: %s", e)
+                result = _create_error_response(text, str(e))
+            else:
+                # Chunked results are only usable once merged, so there is
+                # nothing to stream early
+                if len(chunks) > 1:
+                    result = await run_synthesis_analysis(text)
+        # Checked again: another request may have started the run meanwhile
+        task = _in_flight.get(key)
+        if result is None and task is not None:
+            result = await asyncio.shield(task)
+
+    if result is not None:
+        for section in ("foundational_assumptions", "synthesized_text", "omissions"):
+            yield section, getattr(result, section)
+        return
+
+    events: "asyncio.Queue[Optional[Tuple[str, Any]]]" = asyncio.Queue()
+    task = asyncio.ensure_future(_stream_analyze(text, key, events))
+    _in_flight[key] = task
+    task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+    # The run doesn't depend on this consumer: if the client disconnects it
+    # still completes for the requests waiting on it, and for the cache
+    streamed = set()
+    while (event := await events.get()) is not None:
+        streamed.add(event[0])
+        yield event
+
+    # A run that failed part way returns an error response; it fills in
+    # the sections that never arrived
+    result = await asyncio.shield(task)
+    for section in ("foundational_assumptions", "synthesized_text", "omissions"):
+        if section not in streamed:
+            yield section, getattr(result, section)
+
+
+async def _stream_analyze(text: str, key: str,
+                          events: "asyncio.Queue[Optional[Tuple[str, Any]]]") -> SynthesisResult:
+    """
+    Run the split pipeline for one text, putting each (section, value) on
+    ``events`` as it arrives and None once done, and cache the assembled
+    result if no section had to fall back.
+    """
+    sections = {}
+    complete = True
+    try:
+        async for section, value, section_complete in _get_pipeline().astream(text):
+            sections[section] = value
+            complete = complete and section_complete
+            events.put_nowait((section, value))
+        synthesis_result = SynthesisResult.model_validate(sections)
+    except Exception as e:
+        logger.error("Error during DSPy synthesis analysis: %s", e)
+        return _create_error_response(text, str(e))
+    finally:
+        events.put_nowait(None)
+
+    # Only cache full successes so transient failures are retried
+    if complete:
+        await _result_cache.set(key, synthesis_result)
+    return synthesis_result
+
+
 def _create_error_response(text: str, error_message: str) -> SynthesisResult:
     """Create a minimal error response when the entire analysis fails."""
-    print(f"Creating error response for: {error_message}")
-
-    # At minimum, provide a basic sentence breakdown
-    sentences = [s.strip() + "." for s in text.split('.') if s.strip()]
-    basic_sentences = []
-
-    for sentence in sentences[:5]:  # Limit to first 5 sentences
-        basic_sentences.append(SynthesizedSentence(
-            sentence=sentence,
-            bias_score=0.0,
-            justification="Analysis unavailable due to system error",
-            tactics=[]
-        ))
-
-    return SynthesisResult(
-        foundational_assumptions=[f"Analysis failed: {error_message}"],
-        synthesized_text=basic_sentences,
-        omissions=[Omission(
-            omitted_perspective="Complete analysis unavailable",
-            potential_impact=f"System error prevented full analysis: {error_message}"
-        )]
-    )
+    logger.warning("Creating error response for: %s", error_message)
+    result = error_response(text, error_message)
+    del result["complete"]
+    return SynthesisResult.model_validate(result)
@@ -3,218 +3,156 @@ Dummy data service to provide sample analysis results when USE_DUMMY_DATA=True.
 This allows users to see the functionality without making expensive LLM API calls.
 """
 
+from functools import lru_cache
+from importlib import resources
+from core.text_utils import first_sentences, iter_sentences
 from models.analysis import SynthesisResult, SynthesizedSentence, EmbeddedTactic, Omission
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
+
+
+# Loaded on first use, so it costs nothing when dummy data is off. The data
+# lives in dummy_data.json next to this module and is validated in one pass
+# by pydantic-core.
+@lru_cache(maxsize=1)
+def _dummy_result() -> SynthesisResult:
+    """The comprehensive dummy result, shared by every caller."""
+    data = resources.files(__package__).joinpath("dummy_data.json").read_bytes()
+    return SynthesisResult.model_validate_json(data)
 
 
 def get_dummy_synthesis_result(text: str) -> SynthesisResult:
     """
     Returns a comprehensive dummy analysis result for demonstration purposes.
 
+    The result doesn't depend on the text, so it is built on the first call
+    and the same instance is returned to every caller.
+
     Args:
         text: The input text (used for context but actual analysis is mocked)
 
     Returns:
         SynthesisResult with realistic dummy data
     """
+    return _dummy_result()
 
-    # Create dummy tactics
-    dummy_tactics = [
-        EmbeddedTactic(
-            phrase="external hands start extracting",
-            tactic="Loaded Language",
-            explanation="Uses emotionally charged language to frame resource extraction as inherently exploitative",
-            type="framing"
-        ),
-        EmbeddedTactic(
-            phrase="boom, the whole balance shatters",
-            tactic="Dramatic Escalation",
-            explanation="Uses dramatic language to amplify the perceived consequences",
-            type="emotional manipulation"
-        ),
-        EmbeddedTactic(
-            phrase="Now let's play fair",
-            tactic="False Fairness Appeal",
-            explanation="Presents a biased premise as if it's the fair or reasonable position",
-            type="false premise"
-        ),
-        EmbeddedTactic(
-            phrase="That's the common-sense view, right?",
-            tactic="Rhetorical Validation",
-            explanation="Uses rhetorical questions to make contested claims seem obvious",
-            type="consensus manipulation"
-        ),
-        EmbeddedTactic(
-            phrase="things get spicy",
-            tactic="Casual Metaphor",
-            explanation="Uses informal language to normalize complex political-economic conflicts",
-            type="minimization"
-        ),
-        EmbeddedTactic(
-            phrase="mass-producing aspirations",
-            tactic="Industrial Metaphor",
-            explanation="Frames human desires and goals as manufactured products to suggest manipulation",
-            type="mechanistic framing"
-        )
-    ]
-
-    # Create dummy synthesized sentences with varied bias scores and tactics
-    dummy_sentences = [
-        SynthesizedSentence(
-            sentence="Every country, every piece of land, has the raw potential for a happy, satisfied life.",
-            bias_score=0.3,
-            justification="Presents an idealistic view that oversimplifies complex geopolitical realities and assumes universal definitions of 'happiness' and 'satisfaction'",
-            tactics=[]
-        ),
-        SynthesizedSentence(
-            sentence="But the moment external hands start extracting resources without contributing to local development.. boom, the whole balance shatters.",
-            bias_score=-0.7,
-            justification="Uses loaded language and dramatic framing to portray all external resource extraction as inherently destructive, ignoring potential benefits or collaborative arrangements",
-            tactics=[dummy_tactics[0], dummy_tactics[1]]
-        ),
-        SynthesizedSentence(
-            sentence="Now let's play fair.",
-            bias_score=-0.4,
-            justification="Frames the following argument as inherently fair while actually introducing contested political premises",
-            tactics=[dummy_tactics[2]]
-        ),
-        SynthesizedSentence(
-            sentence="Assume nation-states are real.",
-            bias_score=0.1,
-            justification="While seemingly neutral, this assumption privileges the Westphalian state system over other forms of political organization",
-            tactics=[]
-        ),
-        SynthesizedSentence(
-            sentence="Tangible.",
-            bias_score=0.2,
-            justification="Emphasizes the material reality of borders while ignoring their constructed and contested nature",
-            tactics=[]
-        ),
-        SynthesizedSentence(
-            sentence="The rightful owners of the land within their borders.",
-            bias_score=-0.6,
-            justification="Presents a highly contested claim about territorial sovereignty as fact, ignoring indigenous rights and historical complexities",
-            tactics=[]
-        ),
-        SynthesizedSentence(
-            sentence="That's the common-sense view, right?",
-            bias_score=-0.5,
-            justification="Uses rhetorical validation to make a contested political position seem like obvious common sense",
-            tactics=[dummy_tactics[3]]
-        ),
-        SynthesizedSentence(
-            sentence="So if \"progress\" exists, it's only valid under the assumption that nations are using their resources well and running their ideologies efficiently.",
-            bias_score=0.4,
-            justification="Makes progress conditional on national efficiency while putting 'progress' in scare quotes, suggesting skepticism about the concept itself",
-            tactics=[]
-        ),
-        SynthesizedSentence(
-            sentence="But that's where things get spicy because not everyone wants the same life.",
-            bias_score=-0.3,
-            justification="Uses casual language to minimize serious ideological conflicts and cultural differences",
-            tactics=[dummy_tactics[4]]
-        ),
-        SynthesizedSentence(
-            sentence="Cue the arrival of economic and political ideology.",
-            bias_score=0.2,
-            justification="Presents ideology as something external that 'arrives' rather than something inherent to all political systems",
-            tactics=[]
-        ),
-        SynthesizedSentence(
-            sentence="And when ideals start mass-producing aspirations, you've got yourself a system of control.",
-            bias_score=-0.8,
-            justification="Uses industrial metaphors to frame all ideological influence as manipulative control, ignoring legitimate political mobilization",
-            tactics=[dummy_tactics[5]]
-        )
-    ]
-
-    # Create dummy foundational assumptions
-    dummy_assumptions = [
-        "Nation-states are the primary legitimate political units for organizing society",
-        "External resource extraction is inherently exploitative rather than potentially beneficial",
-        "There exists an objective measure of how well nations 'use their resources'",
-        "Political ideologies are primarily systems of control rather than genuine belief systems",
-        "Progress is a questionable concept that may not exist in any meaningful sense",
-        "All aspirations created by ideological systems are artificially manufactured rather than authentic"
-    ]
-
-    # Create dummy omissions
-    dummy_omissions = [
-        Omission(
-            omitted_perspective="Indigenous sovereignty and land rights",
-            potential_impact="Fails to acknowledge that many current nation-state borders were established through colonization, ignoring indigenous claims and alternative concepts of territorial sovereignty"
-        ),
-        Omission(
-            omitted_perspective="Benefits of international trade and cooperation",
-            potential_impact="The framing of all external involvement as extractive ignores mutual benefits, technology transfer, and collaborative development that can result from international engagement"
-        ),
-        Omission(
-            omitted_perspective="Historical context of resource extraction",
-            potential_impact="Lacks discussion of how colonial histories shape current resource relationships, missing important context for understanding contemporary dynamics"
-        ),
-        Omission(
-            omitted_perspective="Alternative political organization models",
-            potential_impact="By assuming nation-states as the natural unit, it ignores federal systems, supranational governance, and other forms of political organization"
-        ),
-        Omission(
-            omitted_perspective="Positive aspects of ideological mobilization",
-            potential_impact="Framing all ideology as control mechanisms ignores how shared values and ideals can enable positive social movements and democratic participation"
-        )
-    ]
 
-    return SynthesisResult(
-        foundational_assumptions=dummy_assumptions,
-        synthesized_text=dummy_sentences,
-        omissions=dummy_omissions
-    )
+# Template for the simple result's tactic; only the phrase varies per text
+_SAMPLE_TACTIC = EmbeddedTactic.model_construct(
+    phrase="",
+    tactic="Sample Tactic",
+    explanation="This is a demonstration of how rhetorical tactics would be identified",
+    type="demo"
+)
+
+
+# (bias score, justification) for each of the simple result's sentences
+_SIMPLE_SCORES = tuple(
+    (bias_score,
+     f"Demo analysis: This sentence shows {abs(bias_score):.1f} level of bias {'toward' if bias_score > 0 else 'against'} the presented viewpoint.")
+    for bias_score in (0.2, -0.4, 0.1)  # Varied scores
+)
+
+
+def _sample_tactics(sentence: str) -> Tuple[EmbeddedTactic, ...]:
+    """The sample tactic for a sentence, tagged on its first few words."""
+    words = sentence.split(maxsplit=3)
+    phrase = " ".join(words[:3]) if len(words) >= 3 else sentence
+    return (_SAMPLE_TACTIC.model_copy(update={"phrase": phrase}),)
+
+
+def iter_dummy_sentences(text: str) -> Iterator[SynthesizedSentence]:
+    """
+    Yields the simple dummy analysis of the first sentences of a text, one at
+    a time. Sentences are split lazily, so only the analyzed ones are read.
+
+    Args:
+        text: The input text
+
+    Yields:
+        SynthesizedSentence for each of up to 3 leading sentences
+    """
+    return _score_sentences(iter_sentences(text))
+
+
+def _score_sentences(sentences: Iterable[str]) -> Iterator[SynthesizedSentence]:
+    """The simple dummy analysis of up to 3 sentences, in order."""
+    # Every value below is known to be valid, so the models are built with
+    # model_construct, skipping validation. The scores come first in zip so
+    # no sentence past the last score is split off.
+    scored = zip(_SIMPLE_SCORES, sentences)
+    for i, ((bias_score, justification), sentence) in enumerate(scored):
+        yield SynthesizedSentence.model_construct(
+            sentence=sentence,
+            bias_score=bias_score,
+            justification=justification,
+            # Only add tactics to middle sentence
+            tactics=_sample_tactics(sentence) if i == 1 else ()
+        )
 
 
 def get_dummy_simple_result(text: str) -> SynthesisResult:
     """
     Returns a simpler dummy result for shorter texts or quick demonstrations.
 
+    Only the leading sentences are analyzed, so results are cached per those
+    sentences (not the whole, unbounded text) and shared between callers.
+
     Args:
         text: The input text
 
     Returns:
         SynthesisResult with basic dummy data
     """
+    return _simple_result(tuple(first_sentences(text, len(_SIMPLE_SCORES))))
 
-    # Simple sentence analysis
-    sentences = [s.strip() + "." for s in text.split('.')
-                 if s.strip()][:3]  # Max 3 sentences
 
-    dummy_sentences = []
-    bias_scores = [0.2, -0.4, 0.1]  # Varied scores
-
-    for i, sentence in enumerate(sentences):
-        bias_score = bias_scores[i] if i < len(bias_scores) else 0.0
-
-        dummy_sentences.append(SynthesizedSentence(
-            sentence=sentence,
-            bias_score=bias_score,
-            justification=f"Demo analysis: This sentence shows {abs(bias_score):.1f} level of bias {'toward' if bias_score > 0 else 'against'} the presented viewpoint.",
-            tactics=[
-                EmbeddedTactic(
-                    phrase=" ".join(sentence.split()[:3]) if len(
-                        sentence.split()) >= 3 else sentence,  # First few words
-                    tactic="Sample Tactic",
-                    explanation="This is a demonstration of how rhetorical tactics would be identified",
-                    type="demo"
-                )
-            ] if i == 1 else []  # Only add tactics to middle sentence
-        ))
-
-    return SynthesisResult(
-        foundational_assumptions=[
+@lru_cache(maxsize=256)
+def _simple_result(sentences: Tuple[str, ...]) -> SynthesisResult:
+    """The simple dummy result for the given leading sentences."""
+    return SynthesisResult.model_construct(
+        foundational_assumptions=(
             "Demo assumption: This is an example of a foundational assumption that would be identified",
             "Demo assumption: Another example assumption underlying the argument"
-        ],
-        synthesized_text=dummy_sentences,
-        omissions=[
-            Omission(
+        ),
+        synthesized_text=tuple(_score_sentences(sentences)),
+        omissions=(
+            Omission.model_construct(
                 omitted_perspective="Alternative viewpoint demonstration",
                 potential_impact="This shows how missing perspectives would be identified in the analysis"
-            )
-        ]
+            ),
+        )
     )
+
+
+# Texts containing the default example get the comprehensive result
+_DEFAULT_EXAMPLE_MARKER = "Every country, every piece of land"
+
+
+def get_dummy_result(text: str) -> SynthesisResult:
+    """
+    Returns the dummy result for a text: the comprehensive one for the
+    default example text, or the simple one for other inputs.
+
+    Args:
+        text: The input text
+
+    Returns:
+        SynthesisResult with dummy data
+    """
+    if _DEFAULT_EXAMPLE_MARKER in text:
+        return get_dummy_synthesis_result(text)
+    return get_dummy_simple_result(text)
+
+
+def get_dummy_synthesis_results(texts: List[str]) -> List[SynthesisResult]:
+    """
+    Returns dummy results for several texts at once, e.g. for batch requests
+    or load testing. Results are shared between texts and callers.
+
+    Args:
+        texts: The input texts
+
+    Returns:
+        One SynthesisResult per text, in input order
+    """
+    return [get_dummy_result(text) for text in texts]
@@ -0,0 +1,73 @@
+"""
+The output fields of the DSPy signatures must parse into the app's models
+from the JSON object an LM returns in JSON mode.
+"""
+
+import orjson
+import dspy
+from core.dspy_program import (
+    CombinedDeconstructionSignature,
+    FoundationalAssumptionsSignature,
+    OmissionsAnalysisSignature,
+    SentenceAnalysisSignature,
+)
+from models.analysis import EmbeddedTactic, Omission, SynthesizedSentence
+
+ASSUMPTIONS = ["Markets reward merit", "Growth is always good"]
+ANALYSIS = [{
+    "sentence": "Only a fool would ignore this deal.",
+    "bias_score": 0.8,
+    "justification": "\"Only a fool\" pressures the reader.",
+    "tactics": [{
+        "phrase": "Only a fool",
+        "tactic": "Loaded Language",
+        "explanation": "Shames anyone who disagrees.",
+        "type": "Emotional Appeal",
+    }],
+}]
+OMISSIONS = [{
+    "omitted_perspective": "Workers affected by the deal",
+    "potential_impact": "Readers miss who bears the costs.",
+}]
+
+
+def _parse(signature, fields):
+    return dspy.JSONAdapter().parse(signature, orjson.dumps(fields).decode())
+
+
+def _assert_sentences(sentences):
+    assert len(sentences) == 1
+    sentence = sentences[0]
+    assert isinstance(sentence, SynthesizedSentence)
+    assert sentence.bias_score == 0.8
+    assert sentence.tactics == (EmbeddedTactic(**ANALYSIS[0]["tactics"][0]),)
+
+
+def _assert_omissions(omissions):
+    assert omissions == [Omission(**OMISSIONS[0])]
+
+
+def test_foundational_assumptions_signature():
+    parsed = _parse(FoundationalAssumptionsSignature, {"assumptions_json": ASSUMPTIONS})
+    assert parsed["assumptions_json"] == ASSUMPTIONS
+
+
+def test_sentence_analysis_signature():
+    parsed = _parse(SentenceAnalysisSignature, {"analysis_json": ANALYSIS})
+    _assert_sentences(parsed["analysis_json"])
+
+
+def test_omissions_analysis_signature():
+    parsed = _parse(OmissionsAnalysisSignature, {"omissions_json": OMISSIONS})
+    _assert_omissions(parsed["omissions_json"])
+
+
+def test_combined_deconstruction_signature():
+    parsed = _parse(CombinedDeconstructionSignature, {
+        "assumptions_json": ASSUMPTIONS,
+        "analysis_json": ANALYSIS,
+        "omissions_json": OMISSIONS,
+    })
+    assert parsed["assumptions_json"] == ASSUMPTIONS
+    _assert_sentences(parsed["analysis_json"])
+    _assert_omissions(parsed["omissions_json"])